@@ -58,30 +58,36 @@ export class FixieAgentBase {
     offset?: number;
     limit?: number;
   }): Promise<{ agents: FixieAgentBase[]; total: number }> {
-    let agentList: Agent[] = [];
-    let requestOffset = offset;
-    let total = 0;
-    while (true) {
-      const requestLimit = Math.min(limit - agentList.length, 100);
-      if (requestLimit <= 0) {
-        break;
-      }
-      const result = (await client.requestJson(
+    const pageSize = 100;
+    const fetchPage = (requestOffset: number, requestLimit: number) =>
+      client.requestJson(
         `/api/v1/agents?offset=${requestOffset}&limit=${requestLimit}${
           teamId !== undefined ? `&team_id=${teamId}` : ''
-        } `
-      )) as {
+        }`
+      ) as Promise<{
         agents: Agent[];
         pageInfo: {
           totalResultCount: number;
         };
-      };
-      agentList = agentList.concat(result.agents);
-      total = result.pageInfo.totalResultCount;
-      if (result.agents.length < requestLimit) {
-        break;
+      }>;
+
+    // The first page tells us the total number of agents, after which the remaining
+    // pages can be requested concurrently.
+    const firstLimit = Math.min(limit, pageSize);
+    if (firstLimit <= 0) {
+      return { agents: [], total: 0 };
+    }
+    const firstPage = await fetchPage(offset, firstLimit);
+    const total = firstPage.pageInfo.totalResultCount;
+    let agentList = firstPage.agents;
+    if (firstPage.agents.length === firstLimit) {
+      const wanted = Math.min(limit, total - offset);
+      const pageRequests: ReturnType<typeof fetchPage>[] = [];
+      for (let pageOffset = firstLimit; pageOffset < wanted; pageOffset += pageSize) {
+        pageRequests.push(fetchPage(offset + pageOffset, Math.min(wanted - pageOffset, pageSize)));
       }
-      requestOffset += requestLimit;
+      const pages = await Promise.all(pageRequests);
+      agentList = agentList.concat(...pages.map((page) => page.agents));
     }
     return {
       agents: agentList.map((agent: Agent) => new FixieAgentBase(client, agent)),
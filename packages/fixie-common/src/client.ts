@@ -132,6 +132,11 @@ export class FixieClientBase {
         },
         transform(chunk, controller) {
           buffer += chunk;
+          // A long line may arrive over many chunks. Only split once it is complete, rather
+          // than rescanning the whole buffer for every chunk.
+          if (!chunk.includes('\n')) {
+            return;
+          }
           const lines = buffer.split('\n');
           buffer = lines.pop()!;
           for (const line of lines) {
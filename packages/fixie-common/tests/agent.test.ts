@@ -4,6 +4,12 @@ import { jest, beforeEach, afterEach, describe, expect, it } from '@jest/globals
 import { FixieClientBase } from '../src/client';
 import { FixieAgentBase } from '../src/agent';
 
+/** The agent metadata returned by most of the mocked API responses below. */
+const FAKE_AGENT = {
+  agentId: 'fake-agent-id',
+  handle: 'fake-agent-handle',
+};
+
 /** This function mocks out 'fetch' to return the given response. */
 const mockFetch = (response: any) => {
   const mock = jest
@@ -27,10 +33,7 @@ describe('FixieAgentBase Agent tests', () => {
   it('GetAgent works', async () => {
     const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
     const mock = mockFetch({
-      agent: {
-        agentId: 'fake-agent-id',
-        handle: 'fake-agent-handle',
-      },
+      agent: FAKE_AGENT,
     });
     const agent = await FixieAgentBase.GetAgent({ client, agentId: 'fake-agent-id' });
     expect(mock.mock.calls[0][0].toString()).toStrictEqual('https://fake.api.fixie.ai/api/v1/agents/fake-agent-id');
@@ -39,6 +42,17 @@ describe('FixieAgentBase Agent tests', () => {
     expect(agent.agentUrl()).toBe('https://console.fixie.ai/agents/fake-agent-id');
   });
 
+  it('GetAgent fetches fresh metadata on every call', async () => {
+    const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
+    const mock = mockFetch({
+      agent: FAKE_AGENT,
+    });
+    await FixieAgentBase.GetAgent({ client, agentId: 'fake-agent-id' });
+    const agent = await FixieAgentBase.GetAgent({ client, agentId: 'fake-agent-id' });
+    expect(mock.mock.calls.length).toBe(2);
+    expect(agent.handle).toBe('fake-agent-handle');
+  });
+
   it('ListAgents works', async () => {
     const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
     const mock = mockFetch({
@@ -109,6 +123,42 @@ describe('FixieAgentBase Agent tests', () => {
     expect(result.agents[0].agentUrl()).toBe('https://console.fixie.ai/agents/fake-agent-id-1');
   });
 
+  it('ListAgents fetches remaining pages after the first', async () => {
+    const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
+    // Serve a distinct slice of 250 agents for each page, completing later pages first so
+    // that the result would be out of order if pages were combined as they arrived.
+    const mock = jest
+      .fn<typeof global.fetch>()
+      .mockImplementation((input: RequestInfo | URL, _init?: RequestInit | undefined) => {
+        const searchParams = new URL(input.toString()).searchParams;
+        const offset = Number(searchParams.get('offset'));
+        const limit = Number(searchParams.get('limit'));
+        const response = {
+          agents: Array.from({ length: Math.min(limit, 250 - offset) }, (_, i) => ({
+            agentId: `fake-agent-id-${offset + i}`,
+            handle: `fake-agent-handle-${offset + i}`,
+          })),
+          pageInfo: {
+            totalResultCount: 250,
+          },
+        };
+        return new Promise<Response>((resolve) =>
+          setTimeout(() => resolve({ ok: true, status: 200, json: () => response } as Response), 250 - offset)
+        );
+      });
+    global.fetch = mock;
+    const result = await FixieAgentBase.ListAgents({ client });
+    expect(mock.mock.calls.map((call) => call[0].toString())).toStrictEqual([
+      'https://fake.api.fixie.ai/api/v1/agents?offset=0&limit=100',
+      'https://fake.api.fixie.ai/api/v1/agents?offset=100&limit=100',
+      'https://fake.api.fixie.ai/api/v1/agents?offset=200&limit=50',
+    ]);
+    expect(result.total).toBe(250);
+    expect(result.agents.map((agent) => agent.id)).toStrictEqual(
+      Array.from({ length: 250 }, (_, i) => `fake-agent-id-${i}`)
+    );
+  });
+
   it('CreateAgent works', async () => {
     const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
     const mock = mockFetch({
@@ -129,10 +179,7 @@ describe('FixieAgentBase Agent tests', () => {
   it('agent.delete() works', async () => {
     const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
     mockFetch({
-      agent: {
-        agentId: 'fake-agent-id',
-        handle: 'fake-agent-handle',
-      },
+      agent: FAKE_AGENT,
     });
     const agent = await FixieAgentBase.GetAgent({ client, agentId: 'fake-agent-id' });
     expect(agent.id).toBe('fake-agent-id');
@@ -146,8 +193,7 @@ describe('FixieAgentBase Agent tests', () => {
     const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
     mockFetch({
       agent: {
-        agentId: 'fake-agent-id',
-        handle: 'fake-agent-handle',
+        ...FAKE_AGENT,
         moreInfoUrl: 'https://fake.url',
       },
     });
@@ -157,8 +203,7 @@ describe('FixieAgentBase Agent tests', () => {
     expect(agent.metadata.moreInfoUrl).toBe('https://fake.url');
     const mock = mockFetch({
       agent: {
-        agentId: 'fake-agent-id',
-        handle: 'fake-agent-handle',
+        ...FAKE_AGENT,
         description: 'Test agent description',
         moreInfoUrl: 'https://fake.url.2',
       },
@@ -188,10 +233,7 @@ describe('FixieAgentBase logs tests', () => {
     // Create a fake Agent.
     const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
     mockFetch({
-      agent: {
-        agentId: 'fake-agent-id',
-        handle: 'fake-agent-handle',
-      },
+      agent: FAKE_AGENT,
     });
     return FixieAgentBase.GetAgent({ client, agentId: 'fake-agent-id' }).then((a) => {
       agent = a;
@@ -221,6 +263,26 @@ describe('FixieAgentBase logs tests', () => {
   });
 });
 
+describe('FixieAgentBase missing revision tests', () => {
+  // These tests create their own agents, so they don't need the shared setup below.
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it.each([undefined, null, ''])('getCurrentRevision returns null for %p', async (currentRevisionId) => {
+    const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
+    mockFetch({
+      agent: {
+        ...FAKE_AGENT,
+        currentRevisionId,
+      },
+    });
+    const agent = await FixieAgentBase.GetAgent({ client, agentId: 'fake-agent-id' });
+    const revision = await agent.getCurrentRevision();
+    expect(revision).toBe(null);
+  });
+});
+
 describe('FixieAgentBase AgentRevision tests', () => {
   let agent: FixieAgentBase;
 
@@ -229,8 +291,7 @@ describe('FixieAgentBase AgentRevision tests', () => {
     const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
     mockFetch({
       agent: {
-        agentId: 'fake-agent-id',
-        handle: 'fake-agent-handle',
+        ...FAKE_AGENT,
         currentRevisionId: 'initial-revision-id',
       },
     });
@@ -291,48 +352,6 @@ describe('FixieAgentBase AgentRevision tests', () => {
     expect(revision?.isCurrent).toBe(true);
   });
 
-  it('getCurrentRevision returns null for undefined currentRevision', async () => {
-    const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
-    mockFetch({
-      agent: {
-        agentId: 'fake-agent-id',
-        handle: 'fake-agent-handle',
-        currentRevisionId: undefined,
-      },
-    });
-    const agent = await FixieAgentBase.GetAgent({ client, agentId: 'fake-agent-id' });
-    const revision = await agent.getCurrentRevision();
-    expect(revision).toBe(null);
-  });
-
-  it('getCurrentRevision returns null for null currentRevision', async () => {
-    const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
-    mockFetch({
-      agent: {
-        agentId: 'fake-agent-id',
-        handle: 'fake-agent-handle',
-        currentRevisionId: null,
-      },
-    });
-    const agent = await FixieAgentBase.GetAgent({ client, agentId: 'fake-agent-id' });
-    const revision = await agent.getCurrentRevision();
-    expect(revision).toBe(null);
-  });
-
-  it('getCurrentRevision returns null for empty currentRevision', async () => {
-    const client = new FixieClientBase({ url: 'https://fake.api.fixie.ai' });
-    mockFetch({
-      agent: {
-        agentId: 'fake-agent-id',
-        handle: 'fake-agent-handle',
-        currentRevisionId: '',
-      },
-    });
-    const agent = await FixieAgentBase.GetAgent({ client, agentId: 'fake-agent-id' });
-    const revision = await agent.getCurrentRevision();
-    expect(revision).toBe(null);
-  });
-
   it('setCurrentRevision works', async () => {
     expect(agent.metadata.currentRevisionId).toBe('initial-revision-id');
     const mock = mockFetch({});
@@ -9,14 +9,11 @@ import yaml from 'js-yaml';
 import fs from 'fs';
 import terminal from 'terminal-kit';
 import { execSync } from 'child_process';
-import ora from 'ora';
 import os from 'os';
 import path from 'path';
-import { execa } from 'execa';
-import Watcher from 'watcher';
 import net from 'node:net';
-import * as TJS from 'typescript-json-schema';
-import _ from 'lodash';
+import crypto from 'node:crypto';
+import type * as TJS from 'typescript-json-schema';
 
 const { terminal: term } = terminal;
 
@@ -29,6 +26,35 @@ export interface AgentConfig {
   deploymentUrl?: string;
 }
 
+/** Top-level entries of an agent directory whose contents never require `fixie serve` to restart the agent. */
+const WATCH_EXCLUDE_DIRS = new Set(['.git', 'dist', 'node_modules']);
+
+/** How long `fixie serve` waits for file changes to settle before restarting the agent, in milliseconds. */
+const RESTART_DEBOUNCE_MS = 250;
+
+/**
+ * Matches the words in a key, splitting on separators and on camelCase boundaries.
+ * An acronym followed by a capitalized word, as in `XMLParser`, is two words.
+ */
+const KEY_WORD_PATTERN = /[A-Z]{2,}(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+/g;
+
+/**
+ * Convert an agent.yaml key to camelCase, matching lodash's `camelCase` for ASCII keys:
+ * `more_info_url`, `more-info-url`, `MORE_INFO_URL` and `MoreInfoUrl` all become `moreInfoUrl`.
+ */
+function camelCaseKey(key: string): string {
+  const words = key.match(KEY_WORD_PATTERN) ?? [];
+  return words
+    .map((word, index) => {
+      const lower = word.toLowerCase();
+      return index === 0 ? lower : lower.charAt(0).toUpperCase() + lower.slice(1);
+    })
+    .join('');
+}
+
+/** The keys that may appear in an agent.yaml file, after conversion to camelCase. */
+const AGENT_CONFIG_KEYS = new Set(['handle', 'name', 'description', 'moreInfoUrl', 'deploymentUrl']);
+
 /**
  * This class provides an interface to the Fixie Agent API for NodeJS clients.
  */
@@ -44,67 +70,132 @@ export class FixieAgent extends FixieAgentBase {
     return new FixieAgent(client, metadata);
   }
 
+  /** Parsed agent.yaml files, keyed by absolute path. Entries are invalidated when the file's mtime changes. */
+  private static readonly configCache = new Map<string, { mtimeMs: number; config: AgentConfig }>();
+
   /** Load an agent configuration from the given directory. */
   public static LoadConfig(agentPath: string): AgentConfig {
-    const fullPath = path.resolve(path.join(agentPath, 'agent.yaml'));
+    const fullPath = path.resolve(agentPath, 'agent.yaml');
+    const { mtimeMs } = fs.statSync(fullPath);
+    const cached = FixieAgent.configCache.get(fullPath);
+    if (cached && cached.mtimeMs === mtimeMs) {
+      return { ...cached.config };
+    }
+    const config = FixieAgent.parseConfig(fullPath);
+    FixieAgent.configCache.set(fullPath, { mtimeMs, config });
+    return { ...config };
+  }
+
+  /** Read and parse the given agent.yaml file. */
+  private static parseConfig(fullPath: string): AgentConfig {
     const rawConfig = yaml.load(fs.readFileSync(fullPath, 'utf8')) as Partial<AgentConfig>;
     const config: Partial<AgentConfig> = {};
-    Object.keys(rawConfig).forEach((key: string) => {
-      config[_.camelCase(key) as keyof Partial<AgentConfig>] = rawConfig[key as keyof Partial<AgentConfig>];
-    });
-
+    const invalidKeys: string[] = [];
+    for (const rawKey of Object.keys(rawConfig)) {
+      const key = camelCaseKey(rawKey);
+      config[key as keyof Partial<AgentConfig>] = rawConfig[rawKey as keyof Partial<AgentConfig>];
+      if (!AGENT_CONFIG_KEYS.has(key)) {
+        invalidKeys.push(key);
+      }
+    }
     // Warn if any fields are present in config that are not supported.
-    const validKeys = ['handle', 'name', 'description', 'moreInfoUrl', 'deploymentUrl'];
-    const invalidKeys = Object.keys(config).filter((key) => !validKeys.includes(key));
-    for (const key of invalidKeys) {
-      term('❓ Ignoring invalid key ').yellow(key)(' in agent.yaml\n');
+    if (invalidKeys.length) {
+      term(`❓ Ignoring invalid key${invalidKeys.length > 1 ? 's' : ''} `).yellow(invalidKeys.join(', '))(
+        ' in agent.yaml\n'
+      );
     }
     return config as AgentConfig;
   }
 
-  private static inferRuntimeParametersSchema(agentPath: string): TJS.Definition | null {
+  /**
+   * Stub modules used to extract the runtime parameters type, keyed by the agent's handler path.
+   * The stub only depends on the handler path, so `fixie serve` can reuse it across restarts.
+   */
+  private static readonly schemaStubPaths = new Map<string, string>();
+
+  /**
+   * Inferred runtime parameters schemas, keyed by agent directory, along with the mtime of
+   * every file the TypeScript program read to produce them.
+   */
+  private static readonly schemaCache = new Map<
+    string,
+    { sourceMtimes: Map<string, number>; schema: TJS.Definition | null }
+  >();
+
+  /** Return the given file's mtime, or -1 if it no longer exists. */
+  private static fileMtime(filePath: string): number {
+    return fs.statSync(filePath, { throwIfNoEntry: false })?.mtimeMs ?? -1;
+  }
+
+  private static async inferRuntimeParametersSchema(agentPath: string): Promise<TJS.Definition | null> {
     // If there's a tsconfig.json file, try to use Typescript to produce a JSON schema
     // with the runtime parameters for the agent.
-    const tsconfigPath = path.resolve(path.join(agentPath, 'tsconfig.json'));
+    const tsconfigPath = path.resolve(agentPath, 'tsconfig.json');
     if (!fs.existsSync(tsconfigPath)) {
       term.yellow(`⚠️ tsconfig.json not found at ${tsconfigPath}. Your agent will not support runtime parameters.\n`);
       return null;
     }
 
+    // Building the TypeScript program is slow, so `fixie serve` only repeats it on restart if
+    // one of the files it read last time has changed. Files that the program did not read, such
+    // as a newly added module that shadows an existing import or a tsconfig.json it extends,
+    // are not tracked. Editing the importing module or tsconfig.json forces a rebuild.
+    const agentDir = path.resolve(agentPath);
+    const cached = FixieAgent.schemaCache.get(agentDir);
+    if (cached && [...cached.sourceMtimes].every(([filePath, mtimeMs]) => FixieAgent.fileMtime(filePath) === mtimeMs)) {
+      return cached.schema;
+    }
+
+    // typescript-json-schema pulls in the full TypeScript compiler, so only load it when needed.
+    const { programFromConfig, generateSchema } = await import('typescript-json-schema');
     const settings: TJS.PartialArgs = {
       required: true,
       noExtraProps: true,
     };
 
     // We're currently assuming the entrypoint is exported from src/index.{ts,tsx}.
-    const handlerPath = path.resolve(path.join(agentPath, 'src/index.js'));
-    const tempPath = path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'fixie-')), 'extract-parameters-schema.mts');
-    fs.writeFileSync(
-      tempPath,
-      `
+    const handlerPath = path.resolve(agentPath, 'src/index.js');
+    let tempPath = FixieAgent.schemaStubPaths.get(handlerPath);
+    if (!tempPath) {
+      tempPath = path.join(fs.mkdtempSync(path.join(os.tmpdir(), 'fixie-')), 'extract-parameters-schema.mts');
+      fs.writeFileSync(
+        tempPath,
+        `
       import Handler from '${handlerPath}';
       export type RuntimeParameters = Parameters<typeof Handler> extends [infer T, ...any] ? T : {};
       `
-    );
-    const program = TJS.programFromConfig(tsconfigPath, [tempPath]);
-    return TJS.generateSchema(program, 'RuntimeParameters', settings);
+      );
+      FixieAgent.schemaStubPaths.set(handlerPath, tempPath);
+    }
+    const program = programFromConfig(tsconfigPath, [tempPath]);
+    const schema = generateSchema(program, 'RuntimeParameters', settings);
+    const sourcePaths = [tsconfigPath, ...program.getSourceFiles().map((sourceFile) => sourceFile.fileName)];
+    const sourceMtimes = new Map(sourcePaths.map((filePath) => [filePath, FixieAgent.fileMtime(filePath)]));
+    FixieAgent.schemaCache.set(agentDir, { sourceMtimes, schema });
+    return schema;
   }
 
-  /** Package the code in the given directory and return the path to the tarball. */
-  private static getCodePackage(agentPath: string): string {
+  /**
+   * Package the code in the given directory. Returns the path to the tarball, and the temporary
+   * directory containing it, which the caller should remove once the tarball is no longer needed.
+   */
+  private static getCodePackage(agentPath: string): { tarball: string; tempdir: string } {
     // Read the package.json file to get the package name and version.
-    const packageJsonPath = path.resolve(path.join(agentPath, 'package.json'));
+    const packageJsonPath = path.resolve(agentPath, 'package.json');
     const packageJson = JSON.parse(fs.readFileSync(packageJsonPath, 'utf8'));
+    // `npm pack` names the tarball for a scoped package like `@scope/agent` as `scope-agent-<version>.tgz`.
+    const tarballName = `${packageJson.name.replace(/^@/, '').replace('/', '-')}-${packageJson.version}`;
 
     // Create a temporary directory and run `npm pack` inside.
-    const tempdir = fs.mkdtempSync(path.join(os.tmpdir(), `fixie-tmp-${packageJson.name}-${packageJson.version}-`));
+    const tempdir = fs.mkdtempSync(path.join(os.tmpdir(), `fixie-tmp-${tarballName}-`));
     const commandline = `npm pack ${path.resolve(agentPath)}`;
     try {
       execSync(commandline, { cwd: tempdir, stdio: 'inherit' });
     } catch (ex) {
+      fs.rmSync(tempdir, { recursive: true, force: true });
       throw new Error(`\`${commandline}\` failed. Check for build errors above and retry.`);
     }
-    return `${tempdir}/${packageJson.name}-${packageJson.version}.tgz`;
+    return { tarball: path.join(tempdir, `${tarballName}.tgz`), tempdir };
   }
 
   /**
@@ -131,7 +222,7 @@ export class FixieAgent extends FixieAgentBase {
     isCurrent?: boolean;
     environmentVariables?: Record<string, string>;
   }): Promise<AgentRevision> {
-    const tarballData = fs.readFileSync(fs.realpathSync(tarball));
+    const tarballData = await fs.promises.readFile(tarball);
     const codePackage = tarballData.toString('base64');
 
     const result = (await this.client.requestJson(`/api/v1/agents/${this.metadata.agentId}/revisions`, {
@@ -168,12 +259,20 @@ export class FixieAgent extends FixieAgentBase {
     const agentList = await FixieAgentBase.ListAgents({ client, teamId });
     const found = agentList.agents.find((agent) => agent.metadata.handle === config.handle) ?? null;
     if (found) {
-      agent = await this.GetAgent({ client, agentId: found.metadata.agentId });
-      await agent.update({
+      // The listing already returned this agent's metadata, so there's no need to fetch it again.
+      agent = new FixieAgent(client, found.metadata);
+      const metadata = {
         displayName: config.name,
         description: config.description,
         moreInfoUrl: config.moreInfoUrl,
-      });
+      };
+      // Skip the update round trip when agent.yaml doesn't change anything.
+      const changed = Object.entries(metadata).some(
+        ([key, value]) => value !== undefined && value !== found.metadata[key as keyof typeof metadata]
+      );
+      if (changed) {
+        await agent.update(metadata);
+      }
     } else {
       // Try to create the agent instead.
       term('🦊 Creating new agent ').green(config.handle)('...\n');
@@ -190,20 +289,26 @@ export class FixieAgent extends FixieAgentBase {
     return agent as FixieAgent;
   }
 
-  static spawnAgentProcess(agentPath: string, port: number, env: Record<string, string>) {
+  /** Build the agent in the given directory and start it locally on the given port. */
+  private static async spawnAgentProcess(agentPath: string, port: number, env: Record<string, string>) {
     term(`🌱 Building agent at ${agentPath}...\n`);
-    this.getCodePackage(agentPath);
+    // Only the build that `npm pack` triggers is needed here, not the tarball itself.
+    const { tempdir } = this.getCodePackage(agentPath);
+    fs.rmSync(tempdir, { recursive: true, force: true });
 
-    const pathToCheck = path.resolve(path.join(agentPath, 'dist', 'index.js'));
+    const pathToCheck = path.resolve(agentPath, 'dist', 'index.js');
     if (!fs.existsSync(pathToCheck)) {
       throw Error(`Your agent was not found at ${pathToCheck}. Did the build fail?`);
     }
 
-    const cmdline = `npx --package=@fixieai/sdk fixie-serve-bin --packagePath ./dist/index.js --port ${port}`;
+    // --prefer-offline lets npx reuse a cached @fixieai/sdk rather than checking the registry on every restart.
+    const cmdline = `npx --prefer-offline --package=@fixieai/sdk fixie-serve-bin --packagePath ./dist/index.js --port ${port}`;
     // Split cmdline into the first value (argv0) and a list of arguments separated by spaces.
     term('🌱 Running: ').green(cmdline)('\n');
 
     const [argv0, ...args] = cmdline.split(' ');
+    // Only `fixie serve` spawns processes, so execa is loaded on demand.
+    const { execa } = await import('execa');
     const subProcess = execa(argv0, args, { cwd: agentPath, env });
     term('🌱 Agent process running at PID: ').green(subProcess.pid)('\n');
     subProcess.stdout?.setEncoding('utf8');
@@ -245,13 +350,13 @@ export class FixieAgent extends FixieAgentBase {
     term('🦊 Deploying agent ').green(config.handle)('...\n');
 
     // Check that the package.json path exists in this directory.
-    const packageJsonPath = path.resolve(path.join(agentPath, 'package.json'));
+    const packageJsonPath = path.resolve(agentPath, 'package.json');
     if (!fs.existsSync(packageJsonPath)) {
       throw Error(`No package.json found at ${packageJsonPath}. Only JS-based agents are supported.`);
     }
 
-    const yarnLockPath = path.resolve(path.join(agentPath, 'yarn.lock'));
-    const pnpmLockPath = path.resolve(path.join(agentPath, 'pnpm-lock.yaml'));
+    const yarnLockPath = path.resolve(agentPath, 'yarn.lock');
+    const pnpmLockPath = path.resolve(agentPath, 'pnpm-lock.yaml');
 
     if (fs.existsSync(yarnLockPath)) {
       term.yellow(
@@ -264,17 +369,31 @@ export class FixieAgent extends FixieAgentBase {
       );
     }
 
-    const agent = (await FixieAgent.ensureAgent({ client, config, teamId })) as FixieAgent;
-
-    const runtimeParametersSchema = FixieAgent.inferRuntimeParametersSchema(agentPath);
-    const tarball = FixieAgent.getCodePackage(agentPath);
+    // Creating or updating the agent only needs the network, so let it proceed while the
+    // TypeScript compiler infers the runtime parameters schema.
+    const [agent, runtimeParametersSchema] = await Promise.all([
+      FixieAgent.ensureAgent({ client, config, teamId }),
+      FixieAgent.inferRuntimeParametersSchema(agentPath),
+    ]);
+    const { tarball, tempdir } = FixieAgent.getCodePackage(agentPath);
+    const { default: ora } = await import('ora');
     const spinner = ora(' 🚀 Deploying... (hang tight, this takes a minute or two!)').start();
-    const revision = await agent.createManagedRevision({
-      tarball,
-      environmentVariables,
-      runtimeParametersSchema: (runtimeParametersSchema ?? undefined) as Record<string, unknown> | undefined,
-      defaultRuntimeParameters,
-    });
+    let revision;
+    try {
+      revision = await agent.createManagedRevision({
+        tarball,
+        environmentVariables,
+        runtimeParametersSchema: (runtimeParametersSchema ?? undefined) as Record<string, unknown> | undefined,
+        defaultRuntimeParameters,
+      });
+    } catch (error) {
+      // Stop the spinner before the error propagates, so the error isn't printed over the animation.
+      spinner.fail(' 🚀 Deployment failed');
+      throw error;
+    } finally {
+      // The tarball lives in its own temporary directory, which is no longer needed once uploaded.
+      fs.rmSync(tempdir, { recursive: true, force: true });
+    }
     spinner.succeed(`Agent ${config.handle} is running at: ${agent.agentUrl(client.url)}`);
     return revision;
   }
@@ -299,79 +418,24 @@ export class FixieAgent extends FixieAgentBase {
     debug?: boolean;
     teamId?: string;
   }) {
-    const config = await FixieAgent.LoadConfig(agentPath);
+    // Resolve the agent directory once; it is used on every restart.
+    const agentDir = path.resolve(agentPath);
+    const config = await FixieAgent.LoadConfig(agentDir);
     term('🦊 Serving agent ').green(config.handle)('...\n');
 
     // Check if the package.json path exists in this directory.
-    const packageJsonPath = path.resolve(path.join(agentPath, 'package.json'));
+    const packageJsonPath = path.resolve(agentDir, 'package.json');
     if (!fs.existsSync(packageJsonPath)) {
       throw Error(`No package.json found in ${packageJsonPath}. Only JS-based agents are supported.`);
     }
 
-    // Infer the runtime parameters schema. We'll create a generator that yields whenever the schema changes.
-    let runtimeParametersSchema = FixieAgent.inferRuntimeParametersSchema(agentPath);
-
-    console.log(`🌱 Runtime parameters schema: ${JSON.stringify(runtimeParametersSchema)}`);
-
-    const { iterator: schemaGenerator, push: pushToSchemaGenerator } =
-      this.createAsyncIterable<TJS.Definition | null>();
-    pushToSchemaGenerator(runtimeParametersSchema);
-
-    // Start the agent process locally.
-    let agentProcess = FixieAgent.spawnAgentProcess(agentPath, port, environmentVariables);
-
-    // Watch files in the agent directory for changes.
-    const watchPath = path.resolve(agentPath);
-    const watchExcludePaths = [
-      path.resolve(path.join(agentPath, 'dist')),
-      path.resolve(path.join(agentPath, 'node_modules')),
-    ];
-    // Return true if the path matches the prefix of any of the exclude paths.
-    const ignoreFunc = (path: string): boolean => {
-      if (watchExcludePaths.some((excludePath) => path.startsWith(excludePath))) {
-        return true;
-      }
-      return false;
-    };
-    console.log(`🌱 Watching ${watchPath} for changes...`);
-
-    const watcher = new Watcher(watchPath, {
-      ignoreInitial: true,
-      recursive: true,
-      ignore: ignoreFunc,
-    });
-    watcher.on('all', async (event: any, targetPath: string, _targetPathNext: any) => {
-      console.log(`🌱 Restarting local agent process due to ${event}: ${targetPath}`);
-      agentProcess.kill();
-      // Let it shut down gracefully.
-      await new Promise<void>((resolve) => {
-        if (agentProcess.exitCode !== null || agentProcess.signalCode !== null) {
-          resolve();
-        } else {
-          agentProcess.on('close', () => {
-            resolve();
-          });
-        }
-      });
-
-      try {
-        const newSchema = FixieAgent.inferRuntimeParametersSchema(agentPath);
-        if (JSON.stringify(runtimeParametersSchema) !== JSON.stringify(newSchema)) {
-          pushToSchemaGenerator(newSchema);
-          runtimeParametersSchema = newSchema;
-        }
-
-        agentProcess = FixieAgent.spawnAgentProcess(agentPath, port, environmentVariables);
-      } catch (ex) {
-        term(`❌ Failed to restart agent process: ${ex} \n`);
-      }
-    });
-
     // This is an iterator which yields the public URL of the tunnel where the agent
     // can be reached by the Fixie service. The tunnel address can change over time.
+    // The tunnel is started first so that it connects while the agent is being built.
     let deploymentUrlsIter: AsyncIterator<string>;
+    let stopTunnel: (() => void) | undefined;
     if (tunnel) {
-      deploymentUrlsIter = FixieAgent.spawnTunnel(port, Boolean(debug));
+      ({ urls: deploymentUrlsIter, stop: stopTunnel } = await FixieAgent.spawnTunnel(port, Boolean(debug)));
     } else {
       if (!config.deploymentUrl) {
         throw Error('No deployment URL specified in agent.yaml');
@@ -384,66 +448,169 @@ export class FixieAgent extends FixieAgentBase {
       })();
     }
 
-    const agent = await this.ensureAgent({ client, config, teamId });
-    const originalRevision = await agent.getCurrentRevision();
-    if (originalRevision) {
-      term('🥡 Replacing current agent revision ').green(originalRevision.revisionId)('\n');
-    }
-    let currentRevision: AgentRevision | null = null;
-    const doCleanup = async () => {
-      watcher.close();
-      if (originalRevision) {
+    // Everything started from here on is stopped in the finally block below, so that a failure partway
+    // through (e.g. in ensureAgent) doesn't leave the tunnel, watcher or agent process running.
+    let agentProcess: Awaited<ReturnType<typeof FixieAgent.spawnAgentProcess>> | undefined;
+    let watcher: InstanceType<typeof import('watcher').default> | undefined;
+    let restartTimer: ReturnType<typeof setTimeout> | undefined;
+    try {
+      // Infer the runtime parameters schema. We'll create a generator that yields whenever the schema changes.
+      const runtimeParametersSchema = await FixieAgent.inferRuntimeParametersSchema(agentDir);
+      // Keep the serialized form, so that each restart only needs to serialize the new schema to compare.
+      let runtimeParametersSchemaJson = JSON.stringify(runtimeParametersSchema);
+
+      console.log(`🌱 Runtime parameters schema: ${runtimeParametersSchemaJson}`);
+
+      const { iterator: schemaGenerator, push: pushToSchemaGenerator } =
+        this.createAsyncIterable<TJS.Definition | null>();
+      pushToSchemaGenerator(runtimeParametersSchema);
+
+      // Start the agent process locally.
+      agentProcess = await FixieAgent.spawnAgentProcess(agentDir, port, environmentVariables);
+
+      // Watch files in the agent directory for changes.
+      // Content hashes of the files the watcher has reported, so that saving a file without
+      // modifying it (or merely touching it) doesn't trigger a full rebuild and restart.
+      const fileHashes = new Map<string, string>();
+      const contentChanged = (event: string, targetPath: string): boolean => {
+        if (event !== 'add' && event !== 'change') {
+          fileHashes.delete(targetPath);
+          return true;
+        }
+        let hash: string;
         try {
-          await agent.setCurrentRevision(originalRevision.revisionId);
-          term('🥡 Restoring original agent revision ').green(originalRevision.revisionId)('\n');
-        } catch (e: any) {
-          term('🥡 Failed to restore original agent revision: ').red(e.message)('\n');
+          hash = crypto.createHash('sha256').update(fs.readFileSync(targetPath)).digest('hex');
+        } catch {
+          return true;
         }
-      }
-      if (currentRevision) {
+        const previousHash = fileHashes.get(targetPath);
+        fileHashes.set(targetPath, hash);
+        return event === 'add' || previousHash !== hash;
+      };
+      console.log(`🌱 Watching ${agentDir} for changes...`);
+
+      const { default: Watcher } = await import('watcher');
+      watcher = new Watcher(agentDir, {
+        ignoreInitial: true,
+        recursive: true,
+        ignore: (targetPath: string) => FixieAgent.isIgnoredWatchPath(agentDir, targetPath),
+      });
+      const restartAgent = async () => {
+        agentProcess?.kill();
+        // Let it shut down gracefully.
+        await new Promise<void>((resolve) => {
+          if (!agentProcess || agentProcess.exitCode !== null || agentProcess.signalCode !== null) {
+            resolve();
+          } else {
+            agentProcess.on('close', () => {
+              resolve();
+            });
+          }
+        });
+
         try {
-          await agent.deleteRevision(currentRevision.revisionId);
-          term('🥡 Deleting temporary agent revision ').green(currentRevision.revisionId)('\n');
-        } catch (e: any) {
-          term('🥡 Failed to delete temporary agent revision: ').red(e.message)('\n');
+          const newSchema = await FixieAgent.inferRuntimeParametersSchema(agentDir);
+          const newSchemaJson = JSON.stringify(newSchema);
+          if (newSchemaJson !== runtimeParametersSchemaJson) {
+            pushToSchemaGenerator(newSchema);
+            runtimeParametersSchemaJson = newSchemaJson;
+          }
+
+          agentProcess = await FixieAgent.spawnAgentProcess(agentDir, port, environmentVariables);
+        } catch (ex) {
+          term(`❌ Failed to restart agent process: ${ex} \n`);
+        }
+      };
+      // Saving several files at once, or switching git branches, produces a burst of events.
+      // Coalesce them so that the agent is rebuilt and restarted once per burst.
+      watcher.on('all', (event: any, targetPath: string, _targetPathNext: any) => {
+        if (!contentChanged(event, targetPath)) {
+          return;
         }
+        console.log(`🌱 Restarting local agent process due to ${event}: ${targetPath}`);
+        clearTimeout(restartTimer);
+        restartTimer = setTimeout(restartAgent, RESTART_DEBOUNCE_MS);
+      });
+
+      const agent = await this.ensureAgent({ client, config, teamId });
+      const originalRevision = await agent.getCurrentRevision();
+      if (originalRevision) {
+        term('🥡 Replacing current agent revision ').green(originalRevision.revisionId)('\n');
       }
-    };
-    process.on('SIGINT', async () => {
-      console.log('Got Ctrl-C - cleaning up and exiting.');
-      await doCleanup();
-    });
+      let currentRevision: AgentRevision | null = null;
+      const doCleanup = async () => {
+        watcher?.close();
+        clearTimeout(restartTimer);
+        if (originalRevision) {
+          try {
+            await agent.setCurrentRevision(originalRevision.revisionId);
+            term('🥡 Restoring original agent revision ').green(originalRevision.revisionId)('\n');
+          } catch (e: any) {
+            term('🥡 Failed to restore original agent revision: ').red(e.message)('\n');
+          }
+        }
+        if (currentRevision) {
+          try {
+            await agent.deleteRevision(currentRevision.revisionId);
+            term('🥡 Deleting temporary agent revision ').green(currentRevision.revisionId)('\n');
+          } catch (e: any) {
+            term('🥡 Failed to delete temporary agent revision: ').red(e.message)('\n');
+          }
+        }
+      };
+      process.on('SIGINT', async () => {
+        console.log('Got Ctrl-C - cleaning up and exiting.');
+        await doCleanup();
+      });
 
-    // The tunnel may yield different URLs over time. We need to create a new
-    // agent revision each time.
-    for await (const [currentUrl, runtimeParametersSchema] of this.zipAsyncIterables(
-      deploymentUrlsIter,
-      schemaGenerator
-    )) {
-      await FixieAgent.pollPortUntilReady(port);
+      // The tunnel may yield different URLs over time. We need to create a new
+      // agent revision each time.
+      for await (const [currentUrl, runtimeParametersSchema] of this.zipAsyncIterables(
+        deploymentUrlsIter,
+        schemaGenerator
+      )) {
+        await FixieAgent.pollPortUntilReady(port);
 
-      term('🚇 Current tunnel URL is: ').green(currentUrl)('\n');
-      try {
-        if (currentRevision) {
-          term('🥡 Deleting temporary agent revision ').green(currentRevision.revisionId)('\n');
-          await agent.deleteRevision(currentRevision.revisionId);
-          currentRevision = null;
+        term('🚇 Current tunnel URL is: ').green(currentUrl)('\n');
+        try {
+          if (currentRevision) {
+            term('🥡 Deleting temporary agent revision ').green(currentRevision.revisionId)('\n');
+            await agent.deleteRevision(currentRevision.revisionId);
+            currentRevision = null;
+          }
+          currentRevision = await agent.createRevision({
+            externalUrl: currentUrl,
+            runtimeParametersSchema: (runtimeParametersSchema ?? undefined) as Record<string, unknown>,
+            defaultRuntimeParameters,
+          });
+          term('🥡 Created temporary agent revision ').green(currentRevision.revisionId)('\n');
+          term('🥡 Agent ').green(config.handle)(' is running at: ').green(agent.agentUrl(client.url))('\n');
+        } catch (e: any) {
+          term('🥡 Got error trying to create agent revision: ').red(e.message)('\n');
+          console.error(e);
+          continue;
         }
-        currentRevision = await agent.createRevision({
-          externalUrl: currentUrl,
-          runtimeParametersSchema: (runtimeParametersSchema ?? undefined) as Record<string, unknown>,
-          defaultRuntimeParameters,
-        });
-        term('🥡 Created temporary agent revision ').green(currentRevision.revisionId)('\n');
-        term('🥡 Agent ').green(config.handle)(' is running at: ').green(agent.agentUrl(client.url))('\n');
-      } catch (e: any) {
-        term('🥡 Got error trying to create agent revision: ').red(e.message)('\n');
-        console.error(e);
-        continue;
       }
+    } finally {
+      watcher?.close();
+      clearTimeout(restartTimer);
+      agentProcess?.kill();
+      stopTunnel?.();
     }
   }
 
+  /**
+   * Return true if `fixie serve` should not watch the given path, because it lies inside one of
+   * WATCH_EXCLUDE_DIRS or inside a hidden directory. Hidden files, such as `.env`, are still watched.
+   */
+  private static isIgnoredWatchPath(agentDir: string, targetPath: string): boolean {
+    const components = path.relative(agentDir, targetPath).split(path.sep);
+    return (
+      WATCH_EXCLUDE_DIRS.has(components[0]) ||
+      components.slice(0, -1).some((component) => component.startsWith('.'))
+    );
+  }
+
   private static async pollPortUntilReady(port: number): Promise<void> {
     while (true) {
       try {
@@ -453,7 +620,12 @@ export class FixieAgent extends FixieAgentBase {
             port,
           });
 
-          socket.on('connect', resolve);
+          // The probe connection is only used to detect readiness, so close it straight away
+          // rather than holding a connection open to the agent server.
+          socket.on('connect', () => {
+            socket.destroy();
+            resolve();
+          });
           socket.on('error', reject);
         });
         break;
@@ -516,7 +688,14 @@ export class FixieAgent extends FixieAgentBase {
     }
   }
 
-  private static spawnTunnel(port: number, debug: boolean): AsyncIterator<string> {
+  /**
+   * Start a tunnel to the given local port. Returns an iterator over the tunnel's public URLs,
+   * and a function that stops the tunnel.
+   */
+  private static async spawnTunnel(
+    port: number,
+    debug: boolean
+  ): Promise<{ urls: AsyncIterator<string>; stop: () => void }> {
     const { iterator, push: pushToIterator } = this.createAsyncIterable<string>();
 
     term('🚇 Starting tunnel process...\n');
@@ -524,6 +703,7 @@ export class FixieAgent extends FixieAgentBase {
     // to the provided local port via localhost.run. The subprocess returns a
     // stream of JSON responses, one per line, with the external URL of the tunnel
     // as it changes.
+    const { execa } = await import('execa');
     const subProcess = execa('ssh', [
       '-R',
       // N.B. 127.0.0.1 must be used on Windows (not localhost or 0.0.0.0)
@@ -547,11 +727,16 @@ export class FixieAgent extends FixieAgentBase {
       // We need to do buffering since the data we get from stdout
       // will not necessarily be line-buffered. We can get 0, 1, or more complete
       // lines in a single chunk.
-      currentLine += chunk;
-      let newlineIndex;
-      while ((newlineIndex = currentLine.indexOf('\n')) !== -1) {
-        const line = currentLine.slice(0, newlineIndex);
-        currentLine = currentLine.slice(newlineIndex + 1);
+      // Split the chunk once rather than re-slicing the remaining buffer for every line;
+      // the last element is the (possibly empty) start of the next line.
+      const lines = (currentLine + chunk).split('\n');
+      currentLine = lines.pop() ?? '';
+      for (const line of lines) {
+        // The tunnel reports its address as JSON objects, but ssh may also print banners or
+        // warnings. A cheap prefix check skips those instead of letting JSON.parse throw.
+        if (!line.startsWith('{')) {
+          continue;
+        }
         // Parse data as JSON.
         const pdata = JSON.parse(line);
         // If pdata has the 'address' field, yield it.
@@ -573,6 +758,6 @@ export class FixieAgent extends FixieAgentBase {
       iterator.return?.(null);
     });
 
-    return iterator;
+    return { urls: iterator, stop: () => subProcess.kill() };
   }
 }
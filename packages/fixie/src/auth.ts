@@ -8,8 +8,6 @@ import fs from 'fs';
 import terminal from 'terminal-kit';
 import path from 'path';
 import untildify from 'untildify';
-import axios from 'axios';
-import open from 'open';
 import http from 'http';
 import crypto from 'crypto';
 import net from 'net';
@@ -29,6 +27,9 @@ export const FIXIE_API_URL = 'https://api.fixie.ai';
 /** The file where the Fixie CLI stores its configuration. */
 export const FIXIE_CONFIG_FILE = '~/.config/fixie/config.yaml';
 
+/** The keys that may appear in the Fixie CLI config file. */
+const FIXIE_CONFIG_KEYS = new Set(['apiUrl', 'apiKey']);
+
 /** Load the client configuration from the given file. */
 export function loadConfig(configFile: string): FixieConfig {
   const fullPath = untildify(configFile);
@@ -37,10 +38,11 @@ export function loadConfig(configFile: string): FixieConfig {
   }
   const config = yaml.load(fs.readFileSync(fullPath, 'utf8')) as object;
   // Warn if any fields are present in config that are not supported.
-  const validKeys = ['apiUrl', 'apiKey'];
-  const invalidKeys = Object.keys(config).filter((key) => !validKeys.includes(key));
-  for (const key of invalidKeys) {
-    term('❓ Ignoring invalid key ').yellow(key)(` in ${fullPath}\n`);
+  const invalidKeys = Object.keys(config).filter((key) => !FIXIE_CONFIG_KEYS.has(key));
+  if (invalidKeys.length) {
+    term(`❓ Ignoring invalid key${invalidKeys.length > 1 ? 's' : ''} `).yellow(invalidKeys.join(', '))(
+      ` in ${fullPath}\n`
+    );
   }
   return config as FixieConfig;
 }
@@ -104,17 +106,13 @@ export async function AuthenticateOrLogIn({
   forceReauth?: boolean;
 }): Promise<FixieClient> {
   if (!forceReauth) {
+    // Authenticate() has already verified the key against the API.
     const client = await Authenticate({
       apiUrl,
       configFile,
     });
     if (client) {
-      try {
-        await client.userInfo();
-        return client;
-      } catch (error: any) {
-        // If the client is not authenticated, we will get a 401 error.
-      }
+      return client;
     }
   }
 
@@ -135,6 +133,9 @@ export async function AuthenticateOrLogIn({
   return client;
 }
 
+// How long to wait for the OAuth token exchange to complete, in milliseconds.
+const TOKEN_REQUEST_TIMEOUT_MS = 30000;
+
 // The Fixie CLI client ID.
 const CLIENT_ID = 'II4FM6ToxVwSKB6DW1r114AKAuSnuZEgYehEBB-5WQA';
 // The scopes requested by the OAUth flow.
@@ -166,12 +167,22 @@ async function oauthFlow(apiUrl: string): Promise<string> {
               bodyFormData.append('redirect_uri', redirectUri);
               bodyFormData.append('client_id', CLIENT_ID);
               bodyFormData.append('grant_type', 'authorization_code');
-              const response = await axios.post(`${apiUrl}/access/token`, bodyFormData, {
-                headers: {
-                  'Content-Type': 'multipart/form-data',
-                },
+              // Use fetch (rather than a separate HTTP library) so this request shares the
+              // keep-alive connection pool used by FixieClient for subsequent API calls.
+              const response = await fetch(`${apiUrl}/access/token`, {
+                method: 'POST',
+                body: bodyFormData,
+                // Don't leave the login flow hanging on an unresponsive server.
+                signal: AbortSignal.timeout(TOKEN_REQUEST_TIMEOUT_MS),
               });
-              const accessToken = response.data.access_token;
+              const data = (await response.json().catch(() => ({}))) as {
+                access_token?: unknown;
+                error_description?: string;
+              };
+              if (!response.ok) {
+                throw new Error(data.error_description ?? `${response.status} ${response.statusText}`);
+              }
+              const accessToken = data.access_token;
               if (typeof accessToken === 'string') {
                 res.writeHead(200);
                 res.end('You can close this tab now.');
@@ -184,7 +195,7 @@ async function oauthFlow(apiUrl: string): Promise<string> {
               }
             } catch (error: any) {
               res.writeHead(200);
-              const errMsg = error.response?.data?.error_description ?? error.message;
+              const errMsg = error.message;
               res.end(errMsg);
               reject(error);
             }
@@ -195,6 +206,8 @@ async function oauthFlow(apiUrl: string): Promise<string> {
       .listen(port);
   });
 
+  // Only the interactive login flow needs to launch a browser, so load `open` on demand.
+  const { default: open } = await import('open');
   await open(url);
   term('🔑 Your browser has been opened to visit:\n\n   ').blue.underline(url)('\n\n');
   return serverPromise as Promise<string>;
@@ -0,0 +1,46 @@
+/**
+ * @fileoverview This module defines utility functions for the `fixie` CLI
+ * to cache command results on disk.
+ */
+
+import crypto from 'crypto';
+import fs from 'fs';
+import path from 'path';
+
+/**
+ * Return the path of the file in cacheDir that holds the result for the given key.
+ *
+ * The file name is a hash of the key, so callers can include arbitrary strings such as
+ * API URLs and IDs without worrying about path separators or file name length.
+ */
+export function resultCachePath(cacheDir: string, key: unknown[]): string {
+  const hash = crypto.createHash('sha256').update(JSON.stringify(key)).digest('hex');
+  return path.join(cacheDir, `${hash}.json`);
+}
+
+/** Return the contents of the given cache file, or undefined if it is missing or older than maxAgeMs. */
+export function readCachedResult(cachePath: string, maxAgeMs: number): string | undefined {
+  // A single stat tells us both whether the cache entry exists and how old it is.
+  const cacheStats = fs.statSync(cachePath, { throwIfNoEntry: false });
+  if (!cacheStats || Date.now() - cacheStats.mtimeMs >= maxAgeMs) {
+    return undefined;
+  }
+  return fs.readFileSync(cachePath, 'utf8');
+}
+
+/**
+ * Store the given contents in the cache file.
+ *
+ * Cached results can include secrets, such as a revision's environment variables, so the
+ * cache directory and files are only accessible to the current user.
+ */
+export function writeCachedResult(cachePath: string, contents: string) {
+  // Write to a temporary file and rename it so that concurrent readers never see a partial result.
+  const cacheDir = path.dirname(cachePath);
+  fs.mkdirSync(cacheDir, { recursive: true, mode: 0o700 });
+  // mkdirSync leaves the mode of an existing directory alone, e.g. one created by an older version.
+  fs.chmodSync(cacheDir, 0o700);
+  const tempPath = `${cachePath}.${process.pid}.tmp`;
+  fs.writeFileSync(tempPath, contents, { mode: 0o600 });
+  fs.renameSync(tempPath, cachePath);
+}
@@ -10,8 +10,11 @@ import fs from 'fs';
 import path from 'path';
 import terminal from 'terminal-kit';
 import { fileURLToPath } from 'url';
+import untildify from 'untildify';
 import { FixieAgent } from './agent.js';
 import { AuthenticateOrLogIn, FIXIE_CONFIG_FILE, loadConfig } from './auth.js';
+import { readCachedResult, resultCachePath, writeCachedResult } from './cache.js';
+import { FixieClient } from './client.js';
 import { FixieClientError } from '@fixieai/fixie-common';
 
 const [major] = process.version
@@ -25,15 +28,50 @@ if (major < 18) {
 
 const { terminal: term } = terminal;
 
+/** Where `agent revision list --max-age` keeps cached results. */
+const REVISIONS_CACHE_DIR = '~/.cache/fixie/revisions';
+
+let clientPromise: Promise<FixieClient> | null = null;
+
+/** Return the authenticated client for this invocation, logging in on first use. */
+function getClient(): Promise<FixieClient> {
+  if (!clientPromise) {
+    clientPromise = AuthenticateOrLogIn({ apiUrl: program.opts().url });
+  }
+  return clientPromise;
+}
+
+/** Look up the given agent using the shared client. */
+async function getAgent(agentId: string): Promise<FixieAgent> {
+  return FixieAgent.GetAgent({ client: await getClient(), agentId });
+}
+
+/** Publish or unpublish the given agent, and show its updated metadata. */
+async function setAgentPublished(agentId: string, published: boolean) {
+  const agent = await getAgent(agentId);
+  await agent.update({ published });
+  showResult(agent.metadata, program.opts().raw);
+}
+
 /** Pretty-print a result as JSON. */
 function showResult(result: any, raw: boolean) {
   if (raw) {
-    console.log(JSON.stringify(result));
+    // JSON.stringify is already native; write it straight to stdout rather than through console.log's formatter.
+    process.stdout.write(`${JSON.stringify(result)}\n`);
   } else {
     term.green(JSON.stringify(result, null, 2));
   }
 }
 
+/** Add the provided `key=value` pair to the environment variables collected so far. */
+function parseEnvVar(value: string, previous: Record<string, string> | undefined): Record<string, string> {
+  const separatorIndex = value.indexOf('=');
+  if (separatorIndex === -1) {
+    return { ...previous, [value]: '' };
+  }
+  return { ...previous, [value.slice(0, separatorIndex)]: value.slice(separatorIndex + 1) };
+}
+
 /** Parse the provided value as a Date. */
 function parseDate(value: string): Date {
   const parsedDate = new Date(value);
@@ -43,6 +81,15 @@ function parseDate(value: string): Date {
   return parsedDate;
 }
 
+/** Parse the provided value as a positive whole number of seconds. */
+function parseMaxAge(value: string): number {
+  const seconds = Number(value);
+  if (!Number.isInteger(seconds) || seconds <= 0) {
+    throw new InvalidArgumentError('Must be a positive whole number of seconds.');
+  }
+  return seconds;
+}
+
 function parseJsonObject(value: string): Record<string, unknown> {
   try {
     const parsed = JSON.parse(value);
@@ -55,106 +102,81 @@ function parseJsonObject(value: string): Record<string, unknown> {
   }
 }
 
-/** Deploy an agent from the current directory. */
-function registerDeployCommand(command: Command) {
+/** Add the options shared by the `deploy` and `serve` commands. */
+function addAgentRevisionOptions(command: Command, envTarget: string) {
   command
-    .command('deploy [path]')
-    .description('Deploy an agent')
     .option(
       '--teamId <string>',
       'The team ID to own the new agent. If unspecified, the current user will be the owner.'
     )
     .option(
       '-e, --env <key=value>',
-      'Environment variables to set for this deployment. Variables in a .env file take precedence over those on the command line.',
-      (v, m: Record<string, string> | undefined) => {
-        const [key, value] = v.split('=');
-        return {
-          ...m,
-          // This condition is necessary; the types are wrong.
-          // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
-          [key]: value ?? '',
-        };
-      }
+      `Environment variables to set for ${envTarget}. Variables in a .env file take precedence over those on the command line.`,
+      parseEnvVar
     )
     .option(
       '--default-parameters <json>',
       'Default runtime parameters to set for this revision. Must conform to the schema defined by the agent.',
       parseJsonObject
-    )
-    .action(
-      async (
-        path: string | undefined,
-        options: { teamId: string; env: Record<string, string>; defaultParameters?: Record<string, unknown> }
-      ) => {
-        const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-        await FixieAgent.DeployAgent({
-          client,
-          agentPath: path ?? process.cwd(),
-          environmentVariables: {
-            FIXIE_API_URL: program.opts().url,
-            ...options.env,
-          },
-          defaultRuntimeParameters: options.defaultParameters,
-          teamId: options.teamId,
-        });
-      }
     );
 }
 
+/** Deploy an agent from the current directory. */
+function registerDeployCommand(command: Command) {
+  const deploy = command.command('deploy [path]').description('Deploy an agent');
+  addAgentRevisionOptions(deploy, 'this deployment');
+  deploy.action(
+    async (
+      path: string | undefined,
+      options: { teamId: string; env: Record<string, string>; defaultParameters?: Record<string, unknown> }
+    ) => {
+      const client = await getClient();
+      await FixieAgent.DeployAgent({
+        client,
+        agentPath: path ?? process.cwd(),
+        environmentVariables: {
+          FIXIE_API_URL: program.opts().url,
+          ...options.env,
+        },
+        defaultRuntimeParameters: options.defaultParameters,
+        teamId: options.teamId,
+      });
+    }
+  );
+}
+
 /** Run an agent locally. */
 function registerServeCommand(command: Command) {
-  command
+  const serve = command
     .command('serve [path]')
     .description('Run an agent locally')
-    .option('-p, --port <number>', 'Port to run the agent on', '8181')
-    .option(
-      '--teamId <string>',
-      'The team ID to own the new agent. If unspecified, the current user will be the owner.'
-    )
-    .option(
-      '-e, --env <key=value>',
-      'Environment variables to set for this agent. Variables in a .env file take precedence over those on the command line.',
-      (v, m: Record<string, string> | undefined) => {
-        const [key, value] = v.split('=');
-        return {
-          ...m,
-          // This condition is necessary; the types are wrong.
-          // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
-          [key]: value ?? '',
-        };
+    .option('-p, --port <number>', 'Port to run the agent on', '8181');
+  addAgentRevisionOptions(serve, 'this agent');
+  serve.action(
+    async (
+      path: string | undefined,
+      options: {
+        port: string;
+        teamId: string;
+        env: Record<string, string>;
+        defaultParameters?: Record<string, unknown>;
       }
-    )
-    .option(
-      '--default-parameters <json>',
-      'Default runtime parameters to set for this revision. Must conform to the schema defined by the agent.',
-      parseJsonObject
-    )
-    .action(
-      async (
-        path: string | undefined,
-        options: {
-          port: string;
-          teamId: string;
-          env: Record<string, string>;
-          defaultParameters?: Record<string, unknown>;
-        }
-      ) => {
-        const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-        await FixieAgent.ServeAgent({
-          client,
-          agentPath: path ?? process.cwd(),
-          port: parseInt(options.port),
-          tunnel: true,
-          environmentVariables: {
-            FIXIE_API_URL: program.opts().url,
-            ...options.env,
-          },
-          defaultRuntimeParameters: options.defaultParameters,
-          teamId: options.teamId,
-        });
-      }
-    );
+    ) => {
+      const client = await getClient();
+      await FixieAgent.ServeAgent({
+        client,
+        agentPath: path ?? process.cwd(),
+        port: parseInt(options.port),
+        tunnel: true,
+        environmentVariables: {
+          FIXIE_API_URL: program.opts().url,
+          ...options.env,
+        },
+        defaultRuntimeParameters: options.defaultParameters,
+        teamId: options.teamId,
+      });
+    }
+  );
 }
 
 // Get current version of this package.
@@ -162,12 +184,25 @@ const currentPath = path.dirname(fileURLToPath(import.meta.url));
 const packageJsonPath = path.resolve(currentPath, path.join('..', '..', 'package.json'));
 const packageJson = JSON.parse(fs.readFileSync(packageJsonPath, 'utf-8'));
 
+/** Headline shown for REST API errors with a well-known status code. */
+const ERROR_STATUS_MESSAGES: Partial<Record<number, string>> = {
+  400: '❌ Client made bad request to ',
+  401: '❌ Could not authenticate to the Fixie API at ',
+  403: '❌ Forbidden: ',
+  404: '❌ Not found: ',
+};
+
 function errorHandler(error: any) {
   if (error instanceof FixieClientError) {
     // Error from a REST API call.
     const url = error.url;
+    const message = ERROR_STATUS_MESSAGES[error.statusCode];
+    if (message) {
+      term(message).green(`${url}\n`);
+    } else {
+      term('❌ Error accessing Fixie API at ').green(url)(': ')(error.message)('\n');
+    }
     if (error.statusCode == 401) {
-      term('❌ Could not authenticate to the Fixie API at ').green(`${url}\n`);
       if (process.env.FIXIE_API_URL) {
         term('Your ').green('FIXIE_API_URL')(' is set to ').green(process.env.FIXIE_API_URL)('\n');
         term('Check to ensure that this is the correct API endpoint.\n');
@@ -177,15 +212,8 @@ function errorHandler(error: any) {
         term('Check to ensure that this is the correct key.\n');
       }
     } else if (error.statusCode == 400) {
-      term('❌ Client made bad request to ').green(`${url}\n`);
       term('Please check that you are running the latest version using ').green('npx fixie@latest -V')('\n');
       term('The version of this CLI is: ').green(packageJson.version)('\n');
-    } else if (error.statusCode == 403) {
-      term('❌ Forbidden: ').green(`${url}\n`);
-    } else if (error.statusCode == 404) {
-      term('❌ Not found: ').green(`${url}\n`);
-    } else {
-      term('❌ Error accessing Fixie API at ').green(url)(': ')(error.message)('\n');
     }
     term.green(JSON.stringify(error.detail, null, 2));
   } else {
@@ -221,7 +249,7 @@ user
   .description('Get information on the current user')
   .action(
     catchErrors(async () => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.userInfo();
       showResult(result, program.opts().raw);
     })
@@ -234,7 +262,7 @@ user
   .option('--fullName <string>', 'The new full name for this user')
   .action(
     catchErrors(async (opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.updateUser({ email: opts.email, fullName: opts.fullName });
       showResult(result, program.opts().raw);
     })
@@ -285,7 +313,7 @@ corpus
   .option('--limit <number>', 'Limit on the number of results to return')
   .action(
     catchErrors(async (opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.listCorpora({ teamId: opts.teamId, offset: opts.offset, limit: opts.limit });
       showResult(result, program.opts().raw);
     })
@@ -296,7 +324,7 @@ corpus
   .description('Get information about a corpus.')
   .action(
     catchErrors(async (corpusId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.getCorpus(corpusId);
       showResult(result, program.opts().raw);
     })
@@ -310,7 +338,7 @@ corpus
   .option('--teamId <string>', 'The team ID to own the new Corpus. If unspecified, the current user will own it.')
   .action(
     catchErrors(async (opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.createCorpus({
         name: opts.name,
         description: opts.description,
@@ -327,7 +355,7 @@ corpus
   .option('--description <string>', 'The new description for this corpus')
   .action(
     catchErrors(async (corpusId: string, opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.updateCorpus({
         corpusId,
         displayName: opts.name ?? undefined,
@@ -342,7 +370,7 @@ corpus
   .description('Delete a corpus.')
   .action(
     catchErrors(async (corpusId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.deleteCorpus({ corpusId });
       showResult(result, program.opts().raw);
     })
@@ -353,7 +381,7 @@ corpus
   .description('Query a given corpus.')
   .action(
     catchErrors(async (corpusId: string, query: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.queryCorpus({ corpusId, query });
       showResult(result, program.opts().raw);
     })
@@ -397,7 +425,7 @@ source
             ' if you want to allow all URLs in the crawl.\n'
           );
         }
-        const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+        const client = await getClient();
         const result = await client.addCorpusSource({
           corpusId,
           startUrls,
@@ -417,15 +445,15 @@ source
   .description('Upload local files to a corpus.')
   .action(
     catchErrors(async (corpusId: string, mimeType: string, filenames: string[]) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const result = await client.addCorpusFileSource({
-        corpusId,
-        files: filenames.map((file) => ({
-          filename: path.resolve(file),
-          contents: new Blob([fs.readFileSync(path.resolve(file))]),
-          mimeType,
-        })),
-      });
+      const client = await getClient();
+      // Read the files concurrently rather than one blocking read at a time.
+      const files = await Promise.all(
+        filenames.map(async (file) => {
+          const filename = path.resolve(file);
+          return { filename, contents: new Blob([await fs.promises.readFile(filename)]), mimeType };
+        })
+      );
+      const result = await client.addCorpusFileSource({ corpusId, files });
       showResult(result, program.opts().raw);
     })
   );
@@ -437,7 +465,7 @@ source
   .option('--limit <number>', 'Limit on the number of results to return')
   .action(
     catchErrors(async (corpusId: string, opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.listCorpusSources({ corpusId, offset: opts.offset, limit: opts.limit });
       showResult(result, program.opts().raw);
     })
@@ -448,7 +476,7 @@ source
   .description('Get a source for a corpus.')
   .action(
     catchErrors(async (corpusId: string, sourceId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.getCorpusSource({ corpusId, sourceId });
       showResult(result, program.opts().raw);
     })
@@ -461,7 +489,7 @@ source
   .option('--description <string>', 'The new description for this source')
   .action(
     catchErrors(async (corpusId: string, sourceId: string, opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.updateCorpusSource({
         corpusId,
         sourceId,
@@ -477,7 +505,7 @@ source
   .description('Delete a source from a corpus. The source must have no running jobs or remaining documents.')
   .action(
     catchErrors(async (corpusId: string, sourceId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.deleteCorpusSource({ corpusId, sourceId });
       showResult(result, program.opts().raw);
     })
@@ -492,7 +520,7 @@ source
   )
   .action(
     catchErrors(async (corpusId: string, sourceId: string, { force }) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.refreshCorpusSource({ corpusId, sourceId, force });
       showResult(result, program.opts().raw);
     })
@@ -507,7 +535,7 @@ source
   )
   .action(
     catchErrors(async (corpusId: string, sourceId: string, { force }) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.clearCorpusSource({ corpusId, sourceId, force });
       showResult(result, program.opts().raw);
     })
@@ -523,7 +551,7 @@ job
   .option('--limit <number>', 'Limit on the number of results to return')
   .action(
     catchErrors(async (corpusId: string, sourceId: string, opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.listCorpusSourceJobs({ corpusId, sourceId, offset: opts.offset, limit: opts.limit });
       showResult(result, program.opts().raw);
     })
@@ -534,7 +562,7 @@ job
   .description('Get a job for a source.')
   .action(
     catchErrors(async (corpusId: string, sourceId: string, jobId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.getCorpusSourceJob({ corpusId, sourceId, jobId });
       showResult(result, program.opts().raw);
     })
@@ -550,7 +578,7 @@ doc
   .option('--limit <number>', 'Limit on the number of results to return')
   .action(
     catchErrors(async (corpusId: string, sourceId: string, opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.listCorpusSourceDocuments({
         corpusId,
         sourceId,
@@ -566,7 +594,7 @@ doc
   .description('Get a document from a corpus source.')
   .action(
     catchErrors(async (corpusId: string, sourceId: string, documentId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.getCorpusSourceDocument({ corpusId, sourceId, documentId });
       showResult(result, program.opts().raw);
     })
@@ -581,9 +609,9 @@ agent
   .option('--teamId <string>', 'The team ID to list agents for. If unspecified, the current user will be used.')
   .action(
     catchErrors(async (opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await FixieAgent.ListAgents({ client, teamId: opts.teamId });
-      showResult(await Promise.all(result.agents.map((agent) => agent.metadata)), program.opts().raw);
+      showResult(result.agents.map((agent) => agent.metadata), program.opts().raw);
     })
   );
 
@@ -592,8 +620,7 @@ agent
   .description('Get information about the given agent.')
   .action(
     catchErrors(async (agentId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const result = await FixieAgent.GetAgent({ client, agentId });
+      const result = await getAgent(agentId);
       showResult(result.metadata, program.opts().raw);
     })
   );
@@ -603,10 +630,9 @@ agent
   .description('Delete the given agent.')
   .action(
     catchErrors(async (agentId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const agent = await FixieAgent.GetAgent({ client, agentId });
-      const result = agent.delete();
-      showResult(result, program.opts().raw);
+      const agent = await getAgent(agentId);
+      await agent.delete();
+      showResult({ deletedAgentId: agent.id }, program.opts().raw);
     })
   );
 
@@ -614,24 +640,14 @@ agent
   .command('publish <agentId>')
   .description('Publish the given agent.')
   .action(
-    catchErrors(async (agentId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const agent = await FixieAgent.GetAgent({ client, agentId });
-      const result = agent.update({ published: true });
-      showResult(result, program.opts().raw);
-    })
+    catchErrors((agentId: string) => setAgentPublished(agentId, true))
   );
 
 agent
   .command('unpublish <agentId>')
   .description('Unpublish the given agent.')
   .action(
-    catchErrors(async (agentId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const agent = await FixieAgent.GetAgent({ client, agentId });
-      const result = agent.update({ published: false });
-      showResult(result, program.opts().raw);
-    })
+    catchErrors((agentId: string) => setAgentPublished(agentId, false))
   );
 
 agent
@@ -643,7 +659,7 @@ agent
   .option('--teamId <string>', 'Team ID to own the new agent. If not specified, the current user will own it.')
   .action(
     catchErrors(async (agentHandle: string, opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await FixieAgent.CreateAgent({
         client,
         handle: agentHandle,
@@ -668,8 +684,7 @@ agent
   .option('--message <string>', 'Message ID of logs to return')
   .action(
     catchErrors(async (agentId: string, opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const result = await FixieAgent.GetAgent({ client, agentId });
+      const result = await getAgent(agentId);
       showResult(
         await result.getLogs({
           start: opts.start,
@@ -690,7 +705,7 @@ agent
   .description('Create a new short-lived API key that allows interactions with the given agent.')
   .action(
     catchErrors(async (agentId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.getDelegatedAccessToken({ agentId });
       showResult(result, program.opts().raw);
     })
@@ -707,12 +722,36 @@ revision
   .description('List all revisions for the given agent.')
   .option('--limit <number>', 'Max number of results to return')
   .option('--offset <number>', 'Starting offset of results to return')
+  .option('--max-age <seconds>', 'With --raw, reuse a cached result that is at most this many seconds old', parseMaxAge)
   .action(
     catchErrors(async (agentId: string, opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const agent = await FixieAgent.GetAgent({ client, agentId });
-      const result = agent.listAgentRevisions({ limit: opts.limit, offset: opts.offset });
-      showResult(result, program.opts().raw);
+      const raw = Boolean(program.opts().raw);
+      // Authenticate before consulting the cache, and key it on the API URL and user as well,
+      // so that results are never shared across environments or accounts.
+      const client = await getClient();
+      let cachePath: string | undefined;
+      if (raw && opts.maxAge !== undefined) {
+        const { userId } = await client.userInfo();
+        cachePath = resultCachePath(untildify(REVISIONS_CACHE_DIR), [
+          client.url,
+          userId,
+          agentId,
+          opts.offset ?? 0,
+          opts.limit ?? 100,
+        ]);
+        const cached = readCachedResult(cachePath, opts.maxAge * 1000);
+        if (cached !== undefined) {
+          process.stdout.write(cached);
+          return;
+        }
+      }
+
+      const agent = await getAgent(agentId);
+      const result = await agent.listAgentRevisions({ limit: opts.limit, offset: opts.offset });
+      if (cachePath) {
+        writeCachedResult(cachePath, `${JSON.stringify(result)}\n`);
+      }
+      showResult(result, raw);
     })
   );
 
@@ -721,8 +760,7 @@ revision
   .description('Get current revision for the given agent.')
   .action(
     catchErrors(async (agentId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const agent = await FixieAgent.GetAgent({ client, agentId });
+      const agent = await getAgent(agentId);
       const result = await agent.getCurrentRevision();
       showResult(result, program.opts().raw);
     })
@@ -733,22 +771,36 @@ revision
   .description('Set the current revision for the given agent.')
   .action(
     catchErrors(async (agentId: string, revisionId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const agent = await FixieAgent.GetAgent({ client, agentId });
+      const agent = await getAgent(agentId);
       const result = await agent.setCurrentRevision(revisionId);
       showResult(result, program.opts().raw);
     })
   );
 
 revision
-  .command('delete <agentId> <revisionId>')
-  .description('Delete the given revision for the given agent.')
-  .action(
-    catchErrors(async (agentId: string, revisionId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
-      const agent = await FixieAgent.GetAgent({ client, agentId });
-      const result = await agent.deleteRevision(revisionId);
-      showResult(result, program.opts().raw);
+  .command('delete <agentId> <revisionIds...>')
+  .description('Delete the given revisions for the given agent.')
+  .action(
+    catchErrors(async (agentId: string, revisionIds: string[]) => {
+      const agent = await getAgent(agentId);
+      // Deleting the same revision twice would make the second request fail, so dedupe first.
+      const uniqueRevisionIds = [...new Set(revisionIds)];
+      // Let every delete finish, so that we can report exactly which revisions were deleted.
+      const results = await Promise.allSettled(uniqueRevisionIds.map((revisionId) => agent.deleteRevision(revisionId)));
+      const deletedRevisionIds: string[] = [];
+      const failedRevisionIds: string[] = [];
+      results.forEach((result, index) => {
+        if (result.status === 'fulfilled') {
+          deletedRevisionIds.push(uniqueRevisionIds[index]);
+        } else {
+          failedRevisionIds.push(uniqueRevisionIds[index]);
+          errorHandler(result.reason);
+        }
+      });
+      showResult({ deletedRevisionIds, failedRevisionIds }, program.opts().raw);
+      if (failedRevisionIds.length) {
+        process.exitCode = 1;
+      }
     })
   );
 
@@ -762,7 +814,7 @@ team
   .option('--limit <number>', 'Limit on the number of results to return')
   .action(
     catchErrors(async (opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.listTeams({ offset: opts.offset, limit: opts.limit });
       showResult(result, program.opts().raw);
     })
@@ -773,7 +825,7 @@ team
   .description('Get information about a team')
   .action(
     catchErrors(async (teamId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.getTeam({ teamId });
       showResult(result, program.opts().raw);
     })
@@ -784,7 +836,7 @@ team
   .description('Delete the given team')
   .action(
     catchErrors(async (teamId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.deleteTeam({ teamId });
       showResult(result, program.opts().raw);
     })
@@ -796,7 +848,7 @@ team
   .option('--admin', 'Invite the new member as a team admin')
   .action(
     catchErrors(async (teamId: string, email: string, opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.inviteTeamMember({
         teamId,
         email,
@@ -811,7 +863,7 @@ team
   .description('Cancel a pending invitation for a team membership')
   .action(
     catchErrors(async (teamId: string, email: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.cancelInvitation({
         teamId,
         email,
@@ -825,7 +877,7 @@ team
   .description('Remove a member from a team')
   .action(
     catchErrors(async (teamId: string, userId: string) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.removeTeamMember({
         teamId,
         userId,
@@ -844,7 +896,7 @@ team
       if (opts.admin === undefined) {
         throw new Error('Must specify --admin or --no-admin');
       }
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.updateTeamMember({
         teamId,
         userId,
@@ -861,7 +913,7 @@ team
   .option('--description <string>', 'The description for this team')
   .action(
     catchErrors(async (opts) => {
-      const client = await AuthenticateOrLogIn({ apiUrl: program.opts().url });
+      const client = await getClient();
       const result = await client.createTeam({
         displayName: opts.name,
         description: opts.description,
@@ -3,11 +3,38 @@
  * which is a NodeJS client to the Fixie AI platform.
  */
 
-import { FixieClientBase } from '@fixieai/fixie-common';
+import { FixieClientBase, User } from '@fixieai/fixie-common';
 
 /**
  * A NodeJS client to the Fixie AI platform.
  *
  * For a web client, see the 'fixie-web' package.
  */
-export class FixieClient extends FixieClientBase {}
+export class FixieClient extends FixieClientBase {
+  /** The pending or completed lookup of the current user, shared by repeated userInfo() calls. */
+  private userInfoPromise?: Promise<User>;
+
+  /**
+   * Return information on the currently logged-in user.
+   *
+   * The result is fetched once per client and reused, since the CLI verifies the
+   * API key with this call and commands such as `fixie auth` then ask for it again.
+   */
+  userInfo(): Promise<User> {
+    if (!this.userInfoPromise) {
+      this.userInfoPromise = super.userInfo().catch((error) => {
+        // Don't remember failures, so that a later call can retry.
+        this.userInfoPromise = undefined;
+        throw error;
+      });
+    }
+    return this.userInfoPromise;
+  }
+
+  /** Update the current user's metadata, refreshing the cached user information. */
+  async updateUser(options: { email?: string; fullName?: string }): Promise<User> {
+    const user = await super.updateUser(options);
+    this.userInfoPromise = Promise.resolve(user);
+    return user;
+  }
+}
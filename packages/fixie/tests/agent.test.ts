@@ -1,10 +1,17 @@
 /** Unit tests for agent.ts. */
 
 import fs from 'fs';
+import os from 'os';
+import path from 'path';
 import { jest, afterEach, beforeEach, describe, expect, it } from '@jest/globals';
 import { FixieAgent } from '../src/agent';
 import { FixieClient } from '../src/client';
 
+/** Paths to the agent fixtures used by these tests. */
+const TEST_AGENT_PATH = 'tests/fixtures/test-agent';
+const TEST_AGENT_IGNORE_FIELDS_PATH = 'tests/fixtures/test-agent-ignore-fields';
+const TEST_AGENT_KEY_SPELLINGS_PATH = 'tests/fixtures/test-agent-key-spellings';
+
 /** This function mocks out 'fetch' to return the given response. */
 const mockFetch = (response: any) => {
   const mock = jest
@@ -22,17 +29,100 @@ const mockFetch = (response: any) => {
 
 describe('FixieAgent config file tests', () => {
   it('LoadConfig reads agent config', async () => {
-    const config = FixieAgent.LoadConfig('tests/fixtures/test-agent');
+    const config = FixieAgent.LoadConfig(TEST_AGENT_PATH);
     expect(config.handle).toBe('test-agent');
     expect(config.description).toBe('Test agent description');
     expect(config.moreInfoUrl).toBe('http://fake.url.com/');
   });
   it('LoadConfig ignores unknown fields', async () => {
-    const config = FixieAgent.LoadConfig('tests/fixtures/test-agent-ignore-fields');
+    const config = FixieAgent.LoadConfig(TEST_AGENT_IGNORE_FIELDS_PATH);
     expect(config.handle).toBe('test-agent');
     expect(config.description).toBe('Test agent description');
     expect(config.moreInfoUrl).toBe('http://fake.url.com/');
   });
+  it('LoadConfig accepts capitalized and underscore-prefixed keys', async () => {
+    const config = FixieAgent.LoadConfig(TEST_AGENT_KEY_SPELLINGS_PATH);
+    expect(config.handle).toBe('test-agent');
+    expect(config.description).toBe('Test agent description');
+    expect(config.moreInfoUrl).toBe('http://fake.url.com/');
+    expect(config.deploymentUrl).toBe('http://fake.deployment.url/');
+  });
+  it('LoadConfig returns an independent copy on repeated loads', async () => {
+    const first = FixieAgent.LoadConfig(TEST_AGENT_PATH);
+    first.handle = 'modified-handle';
+    const second = FixieAgent.LoadConfig(TEST_AGENT_PATH);
+    expect(second.handle).toBe('test-agent');
+  });
+});
+
+describe('FixieAgent serve watcher tests', () => {
+  const agentDir = path.resolve('fake-agent');
+  const isIgnored = (relativePath: string): boolean =>
+    (FixieAgent as any).isIgnoredWatchPath(agentDir, path.join(agentDir, relativePath));
+
+  it('watches sources and hidden files such as .env', () => {
+    expect(isIgnored('src/index.ts')).toBe(false);
+    expect(isIgnored('.env')).toBe(false);
+    expect(isIgnored('src/.env.local')).toBe(false);
+    expect(isIgnored('dist-old/index.js')).toBe(false);
+  });
+
+  it('ignores build output, dependencies and hidden directories', () => {
+    expect(isIgnored('.git')).toBe(true);
+    expect(isIgnored('.git/HEAD')).toBe(true);
+    expect(isIgnored('dist/index.js')).toBe(true);
+    expect(isIgnored('node_modules/foo/index.js')).toBe(true);
+    expect(isIgnored('.cache/build.json')).toBe(true);
+  });
+});
+
+describe('FixieAgent runtime parameters schema tests', () => {
+  let agentDir: string;
+
+  /** Write the agent's handler, taking parameters of the given type. */
+  const writeHandler = (parametersType: string) => {
+    fs.writeFileSync(
+      path.join(agentDir, 'src/index.ts'),
+      `export default function Handler(_params: ${parametersType}) {}\n`
+    );
+  };
+
+  const inferSchema = () => (FixieAgent as any).inferRuntimeParametersSchema(agentDir) as Promise<any>;
+
+  beforeEach(() => {
+    agentDir = fs.mkdtempSync(path.join(os.tmpdir(), 'fixie-schema-test-'));
+    fs.mkdirSync(path.join(agentDir, 'src'));
+    fs.writeFileSync(path.join(agentDir, 'package.json'), JSON.stringify({ type: 'module' }));
+    fs.writeFileSync(
+      path.join(agentDir, 'tsconfig.json'),
+      JSON.stringify({
+        compilerOptions: { module: 'node16', moduleResolution: 'node16', strict: true, skipLibCheck: true },
+        include: ['src'],
+      })
+    );
+    writeHandler('{ city: string }');
+  });
+
+  afterEach(() => {
+    fs.rmSync(agentDir, { recursive: true, force: true });
+  });
+
+  it('reuses the schema while the sources are unchanged', async () => {
+    const first = await inferSchema();
+    expect(Object.keys(first.properties)).toStrictEqual(['city']);
+    expect(await inferSchema()).toBe(first);
+  }, 60000);
+
+  it('infers the schema again after a source file changes', async () => {
+    const first = await inferSchema();
+    writeHandler('{ country: string }');
+    // Move the mtime forward explicitly, in case the rewrite lands within the filesystem's timestamp resolution.
+    const later = new Date(Date.now() + 10000);
+    fs.utimesSync(path.join(agentDir, 'src/index.ts'), later, later);
+    const second = await inferSchema();
+    expect(second).not.toBe(first);
+    expect(Object.keys(second.properties)).toStrictEqual(['country']);
+  }, 60000);
 });
 
 describe('FixieAgent AgentRevision tests', () => {
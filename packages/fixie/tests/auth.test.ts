@@ -3,6 +3,10 @@
 import { jest, beforeEach, afterEach, describe, expect, it } from '@jest/globals';
 import { loadConfig, Authenticate } from '../src/auth';
 
+/** Paths to the CLI config fixtures used by these tests. */
+const TEST_CONFIG_PATH = 'tests/fixtures/test-fixie-config.yaml';
+const TEST_CONFIG_IGNORE_FIELDS_PATH = 'tests/fixtures/test-fixie-config-ignore-fields.yaml';
+
 /** This function mocks out 'fetch' to return the given response. */
 const mockFetch = (response: any) => {
   const mock = jest
@@ -22,12 +26,12 @@ describe('FixieConfig tests', () => {
     process.env = {};
   });
   it('loadConfig reads fixie CLI config', async () => {
-    const config = loadConfig('tests/fixtures/test-fixie-config.yaml');
+    const config = loadConfig(TEST_CONFIG_PATH);
     expect(config.apiUrl).toBe('https://fake.api.domain');
     expect(config.apiKey).toBe('test-api-key');
   });
   it('loadConfig ignores unknown fields', async () => {
-    const config = loadConfig('tests/fixtures/test-fixie-config-ignore-fields.yaml');
+    const config = loadConfig(TEST_CONFIG_IGNORE_FIELDS_PATH);
     expect(config.apiUrl).toBe('https://fake.api.domain');
     expect(config.apiKey).toBe('test-api-key');
   });
@@ -45,9 +49,22 @@ describe('Authenticate tests', () => {
         fullName: 'Bob McBeef',
       },
     });
-    const client = await Authenticate({ configFile: 'tests/fixtures/test-fixie-config.yaml' });
+    const client = await Authenticate({ configFile: TEST_CONFIG_PATH });
     expect(client).not.toBeNull();
     expect(client!.apiKey).toBe('test-api-key');
     expect(client!.url).toBe('https://fake.api.domain');
   });
+  it('Authenticate reuses the verified user info', async () => {
+    const mock = mockFetch({
+      user: {
+        userId: 'fake-user-id',
+        email: 'bob@bob.com',
+        fullName: 'Bob McBeef',
+      },
+    });
+    const client = await Authenticate({ configFile: TEST_CONFIG_PATH });
+    const userInfo = await client!.userInfo();
+    expect(userInfo.email).toBe('bob@bob.com');
+    expect(mock.mock.calls.length).toBe(1);
+  });
 });
@@ -0,0 +1,57 @@
+/** Unit tests for cache.ts. */
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { afterEach, beforeEach, describe, expect, it } from '@jest/globals';
+import { readCachedResult, resultCachePath, writeCachedResult } from '../src/cache';
+
+describe('Result cache tests', () => {
+  let cacheDir: string;
+
+  beforeEach(() => {
+    cacheDir = fs.mkdtempSync(path.join(os.tmpdir(), 'fixie-cache-test-'));
+  });
+
+  afterEach(() => {
+    fs.rmSync(cacheDir, { recursive: true, force: true });
+  });
+
+  it('resultCachePath distinguishes API URLs and users', () => {
+    const key = ['fake-agent-id', 0, 100];
+    const paths = new Set([
+      resultCachePath(cacheDir, ['https://api.fixie.ai', 'user-1', ...key]),
+      resultCachePath(cacheDir, ['https://api.fixie.ai', 'user-2', ...key]),
+      resultCachePath(cacheDir, ['https://staging.fixie.ai', 'user-1', ...key]),
+    ]);
+    expect(paths.size).toBe(3);
+  });
+
+  it('resultCachePath stays inside the cache directory', () => {
+    const cachePath = resultCachePath(cacheDir, ['https://api.fixie.ai', 'user-1', '../../etc/passwd', 0, 100]);
+    expect(path.dirname(cachePath)).toBe(cacheDir);
+    expect(path.basename(cachePath)).toMatch(/^[0-9a-f]{64}\.json$/);
+  });
+
+  it('readCachedResult returns fresh results', () => {
+    const cachePath = resultCachePath(cacheDir, ['fake-key']);
+    writeCachedResult(cachePath, '{"revisions":[]}\n');
+    expect(readCachedResult(cachePath, 60000)).toBe('{"revisions":[]}\n');
+  });
+
+  it('writeCachedResult makes the cache readable only by the current user', () => {
+    const cachePath = resultCachePath(path.join(cacheDir, 'revisions'), ['fake-key']);
+    writeCachedResult(cachePath, '{"revisions":[]}\n');
+    expect(fs.statSync(path.dirname(cachePath)).mode & 0o777).toBe(0o700);
+    expect(fs.statSync(cachePath).mode & 0o777).toBe(0o600);
+  });
+
+  it('readCachedResult ignores missing and expired results', () => {
+    const cachePath = resultCachePath(cacheDir, ['fake-key']);
+    expect(readCachedResult(cachePath, 60000)).toBeUndefined();
+    writeCachedResult(cachePath, '{"revisions":[]}\n');
+    const earlier = new Date(Date.now() - 120000);
+    fs.utimesSync(cachePath, earlier, earlier);
+    expect(readCachedResult(cachePath, 60000)).toBeUndefined();
+  });
+});